@@ -32,7 +32,7 @@ class Agent:
         available = Card.list_readers()
         if not available:
             raise RuntimeError("no readers found")
-        for reader in available:
+        for reader in Card.readers_with_card(available):
             try:
                 self._card.connect(reader)
                 lg.info("connected")
@@ -64,9 +64,7 @@ class Agent:
 
     def transmit(self, apdu: APDU) -> Response:
         """Send an APDU, wrapping/unwrapping if a secure channel is active."""
-        if self._channel is not None:
-            apdu = self._channel.wrap(apdu)
-        response = self._card.transmit(apdu)
-        if self._channel is not None:
-            response = self._channel.unwrap(response)
-        return response
+        channel = self._channel
+        if channel is None:
+            return self._card.transmit(apdu)
+        return channel.unwrap(self._card.transmit(channel.wrap(apdu)))
@@ -4,14 +4,10 @@ import logging
 from collections.abc import Callable
 
 from gpexp.core.smartcard import APDU, Response
-from gpexp.core.smartcard.logging import PROTOCOL
+from gpexp.core.smartcard.logging import PROTOCOL, log_status
 
 lg = logging.getLogger(__name__)
 
-_GREEN = "\033[32m"
-_RED = "\033[31m"
-_RESET = "\033[0m"
-
 
 class ISO7816:
     """ISO 7816-4 protocol operations."""
@@ -19,10 +15,10 @@ class ISO7816:
     def __init__(self, transmit: Callable[[APDU], Response]) -> None:
         self._transmit = transmit
 
-    def _send(self, label: str, apdu: APDU) -> Response:
+    def _send(self, apdu: APDU, label: str, *args: object) -> Response:
         resp = self._transmit(apdu)
-        color = _GREEN if resp.sw1 in (0x90, 0x61) else _RED
-        lg.log(PROTOCOL, "%s %s%04X%s", label, color, resp.sw, _RESET)
+        if lg.isEnabledFor(PROTOCOL):
+            log_status(lg, resp.sw, label, *args)
         return resp
 
     # -- commands --
@@ -33,7 +29,7 @@ class ISO7816:
         """SELECT (00 A4). P1=selection method, P2=response control."""
         le: int | None = None if (p2 & 0x0C) == 0x0C else 0x00
         apdu = APDU(cla=0x00, ins=0xA4, p1=p1, p2=p2, data=data, le=le)
-        return self._send(f"SELECT {data.hex().upper()}", apdu)
+        return self._send(apdu, "SELECT %s", data)
 
     def send_read_binary(
         self, offset: int, length: int, *, sfi: int | None = None,
@@ -42,27 +38,29 @@ class ISO7816:
         if sfi is not None:
             p1 = 0x80 | (sfi & 0x1F)
             p2 = offset & 0xFF
-            label = f"READ BINARY SFI={sfi:02X} offset={offset:02X} le={length:02X}"
+            label = "READ BINARY SFI=%02X offset=%02X le=%02X"
+            args: tuple[int, ...] = (sfi, offset, length)
         else:
             p1 = (offset >> 8) & 0x7F
             p2 = offset & 0xFF
-            label = f"READ BINARY offset={offset:04X} le={length:02X}"
+            label = "READ BINARY offset=%04X le=%02X"
+            args = (offset, length)
         apdu = APDU(cla=0x00, ins=0xB0, p1=p1, p2=p2, le=length)
-        return self._send(label, apdu)
+        return self._send(apdu, label, *args)
 
     def send_get_data(self, tag: int) -> Response:
         """Retrieve a data object by tag (00 CA)."""
         p1 = (tag >> 8) & 0xFF
         p2 = tag & 0xFF
         apdu = APDU(cla=0x00, ins=0xCA, p1=p1, p2=p2, le=0x00)
-        return self._send(f"GET DATA {tag:04X}", apdu)
+        return self._send(apdu, "GET DATA %04X", tag)
 
     def send_put_data(self, tag: int, data: bytes) -> Response:
         """Store a data object by tag, simple TLV (00 DA)."""
         p1 = (tag >> 8) & 0xFF
         p2 = tag & 0xFF
         apdu = APDU(cla=0x00, ins=0xDA, p1=p1, p2=p2, data=data)
-        return self._send(f"PUT DATA {tag:04X}", apdu)
+        return self._send(apdu, "PUT DATA %04X", tag)
 
     def send_update_binary(
         self, offset: int, data: bytes, *, sfi: int | None = None,
@@ -71,10 +69,12 @@ class ISO7816:
         if sfi is not None:
             p1 = 0x80 | (sfi & 0x1F)
             p2 = offset & 0xFF
-            label = f"UPDATE BINARY SFI={sfi:02X} offset={offset:02X} len={len(data):02X}"
+            label = "UPDATE BINARY SFI=%02X offset=%02X len=%02X"
+            args: tuple[int, ...] = (sfi, offset, len(data))
         else:
             p1 = (offset >> 8) & 0x7F
             p2 = offset & 0xFF
-            label = f"UPDATE BINARY offset={offset:04X} len={len(data):02X}"
+            label = "UPDATE BINARY offset=%04X len=%02X"
+            args = (offset, len(data))
         apdu = APDU(cla=0x00, ins=0xD6, p1=p1, p2=p2, data=data)
-        return self._send(label, apdu)
+        return self._send(apdu, label, *args)
@@ -3,11 +3,11 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class Message:
     """Base class for messages sent to a terminal."""
 
 
-@dataclass
+@dataclass(slots=True)
 class Result:
     """Base class for typed results from a terminal operation."""
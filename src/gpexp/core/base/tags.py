@@ -1,5 +1,8 @@
 """ISO 7816-4 common TLV tags."""
 
+from collections.abc import Mapping
+from types import MappingProxyType
+
 # FCI (File Control Information)
 FCI_TEMPLATE = 0x6F
 DF_NAME = 0x84
@@ -15,7 +18,7 @@ SHORT_FILE_ID = 0x88
 LIFE_CYCLE_STATUS = 0x8A
 SECURITY_ATTRIBUTES = 0x86
 
-TAG_NAMES: dict[int, str] = {
+TAG_NAMES: Mapping[int, str] = MappingProxyType({
     FCI_TEMPLATE: "FCI Template",
     DF_NAME: "DF Name",
     FCI_PROPRIETARY: "FCI Proprietary Template",
@@ -27,4 +30,4 @@ TAG_NAMES: dict[int, str] = {
     SHORT_FILE_ID: "Short File Identifier",
     LIFE_CYCLE_STATUS: "Life Cycle Status",
     SECURITY_ATTRIBUTES: "Security Attributes",
-}
+})
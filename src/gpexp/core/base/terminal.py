@@ -27,21 +27,28 @@ class Terminal:
     method dispatches to the appropriate handler based on message type.
     """
 
-    _handlers: dict[type[Message], str]
+    _handlers: dict[type[Message], str] = {}
 
     def __init_subclass__(cls, **kwargs: object) -> None:
         super().__init_subclass__(**kwargs)
+        # Each terminal class already holds its full inherited table, so
+        # merging the direct bases is enough — no need to walk the MRO.
         cls._handlers = {}
-        for base in reversed(cls.__mro__):
-            if hasattr(base, "_handlers"):
-                cls._handlers.update(base._handlers)
-        for name in vars(cls):
-            method = getattr(cls, name)
-            if callable(method) and hasattr(method, "_handles_message"):
-                cls._handlers[method._handles_message] = name
+        for base in reversed(cls.__bases__):
+            cls._handlers.update(getattr(base, "_handlers", {}))
+        for name, attr in cls.__dict__.items():
+            message_cls = getattr(attr, "_handles_message", None)
+            if message_cls is not None:
+                cls._handlers[message_cls] = name
 
     def __init__(self, agent: Agent) -> None:
         self._agent = agent
+        # Resolve handler names to bound methods once, so send() is a
+        # single dict lookup per message.
+        self._dispatch: dict[type[Message], Callable[[Message], Result]] = {
+            message_cls: getattr(self, name)
+            for message_cls, name in self._handlers.items()
+        }
 
     def connect(self) -> None:
         """Connect to a card via the agent."""
@@ -53,10 +60,10 @@ class Terminal:
 
     def send(self, message: Message) -> Result:
         """Dispatch a message to the registered handler."""
-        handler_name = self._handlers.get(type(message))
-        if handler_name is None:
+        handler = self._dispatch.get(type(message))
+        if handler is None:
             raise ValueError(f"unsupported message: {message}")
-        return getattr(self, handler_name)(message)
+        return handler(message)
 
     @property
     def supported_messages(self) -> list[type[Message]]:
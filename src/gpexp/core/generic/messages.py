@@ -6,19 +6,19 @@ from gpexp.core.base import Message, Result
 from gpexp.core.smartcard.tlv import TLV
 
 
-@dataclass
+@dataclass(slots=True)
 class ProbeMessage(Message):
     """Request to probe the card for UID, ATR, and default application."""
 
 
-@dataclass
+@dataclass(slots=True)
 class ProbeResult(Result):
     uid: bytes | None
     atr: bytes
     fci: list[TLV]
 
 
-@dataclass
+@dataclass(slots=True)
 class SelectMessage(Message):
     """SELECT by AID (04), DF name (04 0C), or EF file identifier (02 0C)."""
 
@@ -27,13 +27,13 @@ class SelectMessage(Message):
     p2: int = 0x00
 
 
-@dataclass
+@dataclass(slots=True)
 class SelectResult(Result):
     fci: list[TLV]
     sw: int
 
 
-@dataclass
+@dataclass(slots=True)
 class PutDataMessage(Message):
     """PUT DATA — store a data object by tag (simple TLV)."""
 
@@ -41,13 +41,13 @@ class PutDataMessage(Message):
     data: bytes
 
 
-@dataclass
+@dataclass(slots=True)
 class PutDataResult(Result):
     success: bool
     sw: int
 
 
-@dataclass
+@dataclass(slots=True)
 class ReadBinaryMessage(Message):
     """READ BINARY — read from a transparent EF."""
 
@@ -56,13 +56,13 @@ class ReadBinaryMessage(Message):
     sfi: int | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ReadBinaryResult(Result):
     data: bytes
     sw: int
 
 
-@dataclass
+@dataclass(slots=True)
 class UpdateBinaryMessage(Message):
     """UPDATE BINARY — write to a transparent EF."""
 
@@ -71,13 +71,13 @@ class UpdateBinaryMessage(Message):
     sfi: int | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class UpdateBinaryResult(Result):
     success: bool
     sw: int
 
 
-@dataclass
+@dataclass(slots=True)
 class RawAPDUMessage(Message):
     """Send a raw APDU to the card."""
 
@@ -89,7 +89,7 @@ class RawAPDUMessage(Message):
     le: int | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class RawAPDUResult(Result):
     data: bytes
     sw: int
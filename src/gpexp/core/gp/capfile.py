@@ -62,11 +62,17 @@ def _read_cap(path: Path) -> LoadFileInfo:
             name = entry.split("/")[-1].rsplit(".", 1)[0]
             entry_map[name] = entry
 
-        # Concatenate in defined order.
-        buf = bytearray()
-        for component in _CAP_COMPONENTS:
-            if component in entry_map:
-                buf.extend(zf.read(entry_map[component]))
+        # Concatenate in defined order into a buffer sized from the
+        # archive directory.
+        entries = [entry_map[c] for c in _CAP_COMPONENTS if c in entry_map]
+        buf = bytearray(sum(zf.getinfo(entry).file_size for entry in entries))
+        pos = 0
+        for entry in entries:
+            component = zf.read(entry)
+            buf[pos : pos + len(component)] = component
+            pos += len(component)
+        if pos != len(buf):
+            raise ValueError(f"short read from {path}")
 
     data = bytes(buf)
     package_aid, applet_aids = _parse_metadata(data)
@@ -84,11 +90,13 @@ def _parse_metadata(data: bytes) -> tuple[bytes, list[bytes]]:
     package_aid = b""
     applet_aids: list[bytes] = []
 
+    # Walk components over a view; bytes are only copied for the AIDs.
+    mv = memoryview(data)
     offset = 0
-    while offset + 3 <= len(data):
-        tag = data[offset]
-        size = int.from_bytes(data[offset + 1 : offset + 3], "big")
-        comp_data = data[offset + 3 : offset + 3 + size]
+    while offset + 3 <= len(mv):
+        tag = mv[offset]
+        size = (mv[offset + 1] << 8) | mv[offset + 2]
+        comp_data = mv[offset + 3 : offset + 3 + size]
         offset += 3 + size
 
         if tag == 0x01 and len(comp_data) >= 10:
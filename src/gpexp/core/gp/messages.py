@@ -28,35 +28,35 @@ UPS_INTERRUPTED_RESTORE = 0x50
 UPS_INTERRUPTED_CONSOLIDATE = 0x60
 
 
-@dataclass
+@dataclass(slots=True)
 class ListContentsMessage(Message):
     """Request to list all card contents (ISD, applications, packages)."""
 
 
-@dataclass
+@dataclass(slots=True)
 class ListContentsResult(Result):
     isd: list[TLV]
     applications: list[TLV]
     packages: list[TLV]
 
 
-@dataclass
+@dataclass(slots=True)
 class GetCPLCMessage(Message):
     """Request CPLC data (GET DATA 9F7F)."""
 
 
-@dataclass
+@dataclass(slots=True)
 class GetCPLCResult(Result):
     cplc: bytes | None
     sw: int
 
 
-@dataclass
+@dataclass(slots=True)
 class GetCardDataMessage(Message):
     """Fetch GP data objects."""
 
 
-@dataclass
+@dataclass(slots=True)
 class GetCardDataResult(Result):
     key_info: bytes | None
     card_recognition: bytes | None
@@ -65,7 +65,7 @@ class GetCardDataResult(Result):
     seq_counter: int | None
 
 
-@dataclass
+@dataclass(slots=True)
 class AuthenticateMessage(Message):
     """Request to open an SCP03 secure channel."""
 
@@ -75,7 +75,7 @@ class AuthenticateMessage(Message):
     key_id: int = 0x00
 
 
-@dataclass
+@dataclass(slots=True)
 class AuthenticateResult(Result):
     authenticated: bool
     sw: int | None = None
@@ -85,20 +85,20 @@ class AuthenticateResult(Result):
     scp_i: int | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DeleteKeyMessage(Message):
     """Request to DELETE a key set by version number."""
 
     key_version: int
 
 
-@dataclass
+@dataclass(slots=True)
 class DeleteKeyResult(Result):
     success: bool
     sw: int
 
 
-@dataclass
+@dataclass(slots=True)
 class DeleteMessage(Message):
     """Request to DELETE card content (package or applet) by AID."""
 
@@ -106,13 +106,13 @@ class DeleteMessage(Message):
     related: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class DeleteResult(Result):
     success: bool
     sw: int
 
 
-@dataclass
+@dataclass(slots=True)
 class PutKeyMessage(Message):
     """Request to PUT KEY — load a new key set onto the card."""
 
@@ -123,13 +123,13 @@ class PutKeyMessage(Message):
     key_type: int = 0x88
 
 
-@dataclass
+@dataclass(slots=True)
 class PutKeyResult(Result):
     success: bool
     sw: int
 
 
-@dataclass
+@dataclass(slots=True)
 class LoadMessage(Message):
     """Load a package onto the card (INSTALL [for load] + LOAD blocks)."""
 
@@ -139,7 +139,7 @@ class LoadMessage(Message):
     block_size: int = 239
 
 
-@dataclass
+@dataclass(slots=True)
 class LoadResult(Result):
     success: bool
     blocks_sent: int
@@ -147,7 +147,7 @@ class LoadResult(Result):
     error: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class InstallMessage(Message):
     """Install an applet (INSTALL [for install and make selectable])."""
 
@@ -159,13 +159,13 @@ class InstallMessage(Message):
     make_selectable: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class InstallResult(Result):
     success: bool
     sw: int
 
 
-@dataclass
+@dataclass(slots=True)
 class SetStatusMessage(Message):
     """SET STATUS (80 F0) — change lifecycle state."""
 
@@ -174,13 +174,13 @@ class SetStatusMessage(Message):
     aid: bytes = b""
 
 
-@dataclass
+@dataclass(slots=True)
 class SetStatusResult(Result):
     success: bool
     sw: int
 
 
-@dataclass
+@dataclass(slots=True)
 class ManageUpgradeMessage(Message):
     """MANAGE ELF UPGRADE (80 EA)."""
 
@@ -189,7 +189,7 @@ class ManageUpgradeMessage(Message):
     options: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class ManageUpgradeResult(Result):
     success: bool
     sw: int
@@ -3,16 +3,23 @@
 from __future__ import annotations
 
 
-def pad80(data: bytes, block_size: int) -> bytes:
+# Padding suffixes for the DES and AES block sizes, indexed by zero count.
+_PADS: dict[int, tuple[bytes, ...]] = {
+    bs: tuple(b"\x80" + b"\x00" * n for n in range(bs)) for bs in (8, 16)
+}
+
+
+def pad80(data: bytes | bytearray, block_size: int) -> bytes:
     """Apply ISO 9797-1 Method 2 padding to *block_size* boundary."""
-    return data + b"\x80" + b"\x00" * ((-len(data) - 1) % block_size)
+    zeros = (-len(data) - 1) % block_size
+    pads = _PADS.get(block_size)
+    pad = b"\x80" + b"\x00" * zeros if pads is None else pads[zeros]
+    return b"".join((data, pad))
 
 
 def unpad80(data: bytes) -> bytes:
     """Remove ISO 9797-1 Method 2 padding."""
-    i = len(data) - 1
-    while i >= 0 and data[i] == 0x00:
-        i -= 1
-    if i < 0 or data[i] != 0x80:
+    stripped = data.rstrip(b"\x00")
+    if not stripped or stripped[-1] != 0x80:
         raise ValueError("invalid padding")
-    return data[:i]
+    return stripped[:-1]
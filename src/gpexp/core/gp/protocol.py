@@ -4,7 +4,7 @@ import logging
 from collections.abc import Callable
 
 from gpexp.core.smartcard import APDU, Response
-from gpexp.core.smartcard.logging import PROTOCOL
+from gpexp.core.smartcard.logging import PROTOCOL, log_status
 
 SCOPE_ISD = 0x80
 SCOPE_APPS = 0x40
@@ -12,11 +12,10 @@ SCOPE_ELF = 0x20
 
 _SCOPE_NAMES = {SCOPE_ISD: "ISD", SCOPE_APPS: "APPS", SCOPE_ELF: "ELF"}
 
-lg = logging.getLogger(__name__)
+# DELETE key: Key Version Number TLV (tag D2, length 1)
+_DELETE_KEY_VERSION = b"\xD2\x01"
 
-_GREEN = "\033[32m"
-_RED = "\033[31m"
-_RESET = "\033[0m"
+lg = logging.getLogger(__name__)
 
 
 def _c4_wrap(data: bytes) -> bytes:
@@ -35,10 +34,10 @@ class GP:
     def __init__(self, transmit: Callable[[APDU], Response]) -> None:
         self._transmit = transmit
 
-    def _send(self, label: str, apdu: APDU) -> Response:
+    def _send(self, apdu: APDU, label: str, *args: object) -> Response:
         resp = self._transmit(apdu)
-        color = _GREEN if resp.sw1 in (0x90, 0x61) else _RED
-        lg.log(PROTOCOL, "%s %s%04X%s", label, color, resp.sw, _RESET)
+        if lg.isEnabledFor(PROTOCOL):
+            log_status(lg, resp.sw, label, *args)
         return resp
 
     # -- commands --
@@ -48,14 +47,18 @@ class GP:
         p1 = (tag >> 8) & 0xFF
         p2 = tag & 0xFF
         apdu = APDU(cla=0x80, ins=0xCA, p1=p1, p2=p2, le=0x00)
-        return self._send(f"GP GET DATA {tag:04X}", apdu)
+        return self._send(apdu, "GP GET DATA %04X", tag)
 
     def send_get_status(self, scope: int, next_occurrence: bool = False) -> Response:
         """GET STATUS (80 F2) — single command, one scope."""
         p2 = 0x03 if next_occurrence else 0x02
         apdu = APDU(cla=0x80, ins=0xF2, p1=scope, p2=p2, data=b"\x4F\x00", le=0x00)
-        name = _SCOPE_NAMES.get(scope, f"{scope:02X}")
-        return self._send(f"GET STATUS {name}", apdu)
+        # Resolve the scope name only when the status line is actually logged.
+        resp = self._transmit(apdu)
+        if lg.isEnabledFor(PROTOCOL):
+            name = _SCOPE_NAMES.get(scope, f"{scope:02X}")
+            log_status(lg, resp.sw, "GET STATUS %s", name)
+        return resp
 
     def send_initialize_update(
         self, key_version: int, key_id: int, host_challenge: bytes
@@ -65,7 +68,9 @@ class GP:
             cla=0x80, ins=0x50, p1=key_version, p2=key_id,
             data=host_challenge, le=0x00,
         )
-        return self._send(f"INITIALIZE UPDATE ver={key_version:02X} id={key_id:02X}", apdu)
+        return self._send(
+            apdu, "INITIALIZE UPDATE ver=%02X id=%02X", key_version, key_id,
+        )
 
     def send_external_authenticate(
         self, security_level: int, host_cryptogram: bytes
@@ -75,60 +80,62 @@ class GP:
             cla=0x84, ins=0x82, p1=security_level, p2=0x00,
             data=host_cryptogram,
         )
-        return self._send(f"EXTERNAL AUTHENTICATE level={security_level:02X}", apdu)
+        return self._send(apdu, "EXTERNAL AUTHENTICATE level=%02X", security_level)
 
     def send_delete_key(self, key_version: int) -> Response:
         """DELETE (80 E4) — delete key set by version number."""
-        data = bytes([0xD2, 0x01, key_version])
+        data = _DELETE_KEY_VERSION + key_version.to_bytes(1, "big")
         apdu = APDU(cla=0x80, ins=0xE4, p1=0x00, p2=0x00, data=data)
-        return self._send(f"DELETE KEY ver={key_version:02X}", apdu)
+        return self._send(apdu, "DELETE KEY ver=%02X", key_version)
 
     def send_delete(self, aid: bytes, related: bool = False) -> Response:
         """DELETE (80 E4) — delete card content by AID."""
         data = bytes([0x4F, len(aid)]) + aid
         p2 = 0x80 if related else 0x00
         apdu = APDU(cla=0x80, ins=0xE4, p1=0x00, p2=p2, data=data)
-        return self._send(f"DELETE {aid.hex().upper()}", apdu)
+        return self._send(apdu, "DELETE %s", aid)
 
     def send_put_key(self, old_kvn: int, key_id: int, data: bytes) -> Response:
         """PUT KEY (80 D8)."""
         apdu = APDU(cla=0x80, ins=0xD8, p1=old_kvn, p2=key_id, data=data)
-        return self._send(f"PUT KEY old_ver={old_kvn:02X} id={key_id:02X}", apdu)
+        return self._send(apdu, "PUT KEY old_ver=%02X id=%02X", old_kvn, key_id)
 
     def send_manage_elf_upgrade(self, p1: int, data: bytes = b"") -> Response:
         """MANAGE ELF UPGRADE (80 EA)."""
         apdu = APDU(cla=0x80, ins=0xEA, p1=p1, p2=0x00, data=data, le=0x00)
-        return self._send(f"MANAGE ELF UPGRADE P1={p1:02X}", apdu)
+        return self._send(apdu, "MANAGE ELF UPGRADE P1=%02X", p1)
 
     def send_set_status(self, scope: int, status: int, aid: bytes = b"") -> Response:
         """SET STATUS (80 F0)."""
         apdu = APDU(cla=0x80, ins=0xF0, p1=scope, p2=status, data=aid)
-        return self._send(f"SET STATUS scope={scope:02X} status={status:02X}", apdu)
+        return self._send(apdu, "SET STATUS scope=%02X status=%02X", scope, status)
 
     def send_install(self, p1: int, p2: int, data: bytes) -> Response:
         """INSTALL (80 E6)."""
         apdu = APDU(cla=0x80, ins=0xE6, p1=p1, p2=p2, data=data)
-        return self._send(f"INSTALL P1={p1:02X}", apdu)
+        return self._send(apdu, "INSTALL P1=%02X", p1)
 
     def send_load(self, last_block: bool, block_number: int, data: bytes) -> Response:
         """LOAD (80 E8) — single block."""
         p1 = 0x80 if last_block else 0x00
         apdu = APDU(cla=0x80, ins=0xE8, p1=p1, p2=block_number, data=data)
-        return self._send(f"LOAD block={block_number:02X} last={last_block}", apdu)
+        return self._send(
+            apdu, "LOAD block=%02X last=%s", block_number, last_block,
+        )
 
     # -- operations --
 
     def list_content(self, scope: int) -> bytes:
         """GET STATUS sequence — accumulates data across 0x6310 continuations."""
-        buf = bytearray()
+        chunks = []
         resp = self.send_get_status(scope)
         while True:
             if resp.data:
-                buf.extend(resp.data)
+                chunks.append(resp.data)
             if resp.sw != 0x6310:
                 break
             resp = self.send_get_status(scope, next_occurrence=True)
-        return bytes(buf)
+        return b"".join(chunks)
 
     def load_file(self, data: bytes, block_size: int = 239) -> Response:
         """LOAD sequence — split data into blocks and send them all.
@@ -139,12 +146,12 @@ class GP:
         Returns the Response from the last LOAD block.
         """
         wrapped = _c4_wrap(data)
-        blocks = [wrapped[i : i + block_size] for i in range(0, len(wrapped), block_size)]
-        if not blocks:
-            blocks = [b""]
-        for i, block in enumerate(blocks):
-            last = i == len(blocks) - 1
-            resp = self.send_load(last, i, block)
+        # Slice each block as it is sent rather than materialising them all.
+        count = max(1, -(-len(wrapped) // block_size))
+        for i in range(count):
+            offset = i * block_size
+            block = wrapped[offset : offset + block_size]
+            resp = self.send_load(i == count - 1, i, block)
             if not resp.success:
                 return resp
         return resp
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import struct
+
 from cryptography.hazmat.decrepit.ciphers.algorithms import TripleDES
 from cryptography.hazmat.primitives.ciphers import Cipher, modes
 
@@ -17,6 +19,10 @@ _DERIV_S_DEK = b"\x01\x81"
 
 _ZERO_ICV = b"\x00" * 8
 
+_MAC_HEADER = struct.Struct(">BBBBB")  # CLA INS P1 P2 Lc
+_MAC_HEADER_NO_LC = struct.Struct(">BBBB")  # CLA INS P1 P2
+_SW = struct.Struct(">BB")  # SW1 SW2
+
 
 def _tdes_key(key_2k: bytes) -> bytes:
     """Expand 16-byte 2-key 3DES key to 24-byte (K1, K2, K1)."""
@@ -30,50 +36,46 @@ def _tdes_ecb(key_2k: bytes, block: bytes) -> bytes:
     return enc.update(block) + enc.finalize()
 
 
-def _des_ecb(key_2k: bytes, block: bytes) -> bytes:
-    """Single-block one-key 3DES-ECB encrypt (K1 only, equivalent to single DES)."""
-    k1 = key_2k[:8] * 3
-    cipher = Cipher(TripleDES(k1), modes.ECB())
-    enc = cipher.encryptor()
-    return enc.update(block) + enc.finalize()
-
-
-def _tdes_cbc(key_2k: bytes, iv: bytes, data: bytes) -> bytes:
-    """3DES-CBC encrypt."""
-    cipher = Cipher(TripleDES(_tdes_key(key_2k)), modes.CBC(iv))
-    enc = cipher.encryptor()
-    return enc.update(data) + enc.finalize()
-
-
-def _full_mac(key_2k: bytes, icv: bytes, data: bytes) -> bytes:
+def _full_mac(key: TripleDES, icv: bytes, data: bytes) -> bytes:
     """Full 3DES-CBC-MAC (ISO 9797-1 Algorithm 1), Method 2 padding.
 
     All blocks processed with full 3DES; returns the last 8-byte block.
-    Used for card/host cryptogram computation.
+    Used for card/host cryptogram computation.  *key* is the expanded
+    key object so one setup can serve both cryptograms.
     """
-    padded = pad80(data, 8)
-    ct = _tdes_cbc(key_2k, icv, padded)
+    enc = Cipher(key, modes.CBC(icv)).encryptor()
+    ct = enc.update(pad80(data, 8)) + enc.finalize()
     return ct[-8:]
 
 
-def _retail_mac(key_2k: bytes, icv: bytes, data: bytes) -> bytes:
-    """ISO 9797-1 Algorithm 3 (Retail MAC), Method 2 padding.
+class _RetailMac:
+    """ISO 9797-1 Algorithm 3 (Retail MAC), Method 2 padding, for one key.
 
     Single-DES-CBC (K1) for blocks 1..n-1, full 2-key 3DES for block n.
-    Returns 8-byte MAC.  Used for C-MAC / R-MAC.
+    Both ECB encryptors are built once and reused for every block, since
+    an unfinalized ECB encryptor accepts any number of update() calls.
     """
-    padded = pad80(data, 8)
-    k1_3 = key_2k[:8] * 3
-    k_full = _tdes_key(key_2k)
-    cv = icv
-    n = len(padded) // 8
-    for i in range(n):
-        xored = bytes(a ^ b for a, b in zip(padded[i * 8 : (i + 1) * 8], cv))
-        k = k_full if i == n - 1 else k1_3
-        cipher = Cipher(TripleDES(k), modes.ECB())
-        enc = cipher.encryptor()
-        cv = enc.update(xored) + enc.finalize()
-    return cv
+
+    def __init__(self, key_2k: bytes) -> None:
+        self._single = Cipher(TripleDES(key_2k[:8] * 3), modes.ECB()).encryptor()
+        self._full = Cipher(TripleDES(_tdes_key(key_2k)), modes.ECB()).encryptor()
+
+    def encrypt_icv(self, icv: bytes) -> bytes:
+        """Single-DES (K1) ECB encryption of an 8-byte chaining value."""
+        return self._single.update(icv)
+
+    def compute(self, icv: bytes, data: bytes | bytearray) -> bytes:
+        """Return the 8-byte MAC of *data* chained from *icv*."""
+        padded = pad80(data, 8)
+        # XOR each block into the chaining value as one 64-bit integer.
+        from_bytes = int.from_bytes
+        cv = from_bytes(icv, "big")
+        last = len(padded) - 8
+        for i in range(0, last, 8):
+            xored = cv ^ from_bytes(padded[i : i + 8], "big")
+            cv = from_bytes(self._single.update(xored.to_bytes(8, "big")), "big")
+        xored = cv ^ from_bytes(padded[last:], "big")
+        return self._full.update(xored.to_bytes(8, "big"))
 
 
 # -- key derivation ----------------------------------------------------------
@@ -85,20 +87,48 @@ def derive_session_keys(
 ) -> tuple[bytes, bytes, bytes, bytes]:
     """Derive SCP02 session keys from static keys and 2-byte sequence counter."""
 
-    def _derive(key: bytes, constant: bytes) -> bytes:
+    def _derive(key: TripleDES, constant: bytes) -> bytes:
         block = constant + sequence_counter + b"\x00" * 12
-        return _tdes_cbc(key, _ZERO_ICV, block)
-
-    s_enc = _derive(static_keys.enc, _DERIV_S_ENC)
-    s_mac = _derive(static_keys.mac, _DERIV_S_MAC)
-    s_rmac = _derive(static_keys.mac, _DERIV_S_RMAC)
-    s_dek = _derive(static_keys.dek, _DERIV_S_DEK) if static_keys.dek else b""
+        enc = Cipher(key, modes.CBC(_ZERO_ICV)).encryptor()
+        return enc.update(block) + enc.finalize()
+
+    # Expand each static key once; S-MAC and S-RMAC share the MAC key.
+    mac_key = TripleDES(_tdes_key(static_keys.mac))
+    s_enc = _derive(TripleDES(_tdes_key(static_keys.enc)), _DERIV_S_ENC)
+    s_mac = _derive(mac_key, _DERIV_S_MAC)
+    s_rmac = _derive(mac_key, _DERIV_S_RMAC)
+    s_dek = (
+        _derive(TripleDES(_tdes_key(static_keys.dek)), _DERIV_S_DEK)
+        if static_keys.dek else b""
+    )
     return s_enc, s_mac, s_rmac, s_dek
 
 
 # -- cryptograms -------------------------------------------------------------
 
 
+def _card_cryptogram(
+    enc_key: TripleDES,
+    host_challenge: bytes,
+    sequence_counter: bytes,
+    card_challenge: bytes,
+) -> bytes:
+    """Card cryptogram under an already-expanded S-ENC key."""
+    data = host_challenge + sequence_counter + card_challenge
+    return _full_mac(enc_key, _ZERO_ICV, data)
+
+
+def _host_cryptogram(
+    enc_key: TripleDES,
+    host_challenge: bytes,
+    sequence_counter: bytes,
+    card_challenge: bytes,
+) -> bytes:
+    """Host cryptogram under an already-expanded S-ENC key."""
+    data = sequence_counter + card_challenge + host_challenge
+    return _full_mac(enc_key, _ZERO_ICV, data)
+
+
 def verify_card_cryptogram(
     s_enc: bytes,
     host_challenge: bytes,
@@ -107,8 +137,10 @@ def verify_card_cryptogram(
     received: bytes,
 ) -> bool:
     """Verify the card cryptogram from INITIALIZE UPDATE."""
-    data = host_challenge + sequence_counter + card_challenge
-    expected = _full_mac(s_enc, _ZERO_ICV, data)
+    enc_key = TripleDES(_tdes_key(s_enc))
+    expected = _card_cryptogram(
+        enc_key, host_challenge, sequence_counter, card_challenge
+    )
     return expected == received
 
 
@@ -119,8 +151,8 @@ def compute_host_cryptogram(
     card_challenge: bytes,
 ) -> bytes:
     """Compute the host cryptogram for EXTERNAL AUTHENTICATE."""
-    data = sequence_counter + card_challenge + host_challenge
-    return _full_mac(s_enc, _ZERO_ICV, data)
+    enc_key = TripleDES(_tdes_key(s_enc))
+    return _host_cryptogram(enc_key, host_challenge, sequence_counter, card_challenge)
 
 
 # -- session establishment ----------------------------------------------------
@@ -149,15 +181,13 @@ def establish(
 
     s_enc, s_mac, s_rmac, s_dek = derive_session_keys(static_keys, sequence_counter)
 
-    if not verify_card_cryptogram(
-        s_enc, host_challenge, sequence_counter,
-        card_challenge, card_cryptogram,
-    ):
+    # One S-ENC key setup serves both the card and host cryptograms.
+    enc_key = TripleDES(_tdes_key(s_enc))
+    challenges = (host_challenge, sequence_counter, card_challenge)
+    if _card_cryptogram(enc_key, *challenges) != card_cryptogram:
         raise ValueError("card cryptogram mismatch")
 
-    host_cryptogram = compute_host_cryptogram(
-        s_enc, host_challenge, sequence_counter, card_challenge
-    )
+    host_cryptogram = _host_cryptogram(enc_key, *challenges)
 
     channel = SCP02Channel(s_enc, s_mac, s_rmac, security_level, i_param)
 
@@ -200,9 +230,16 @@ class SCP02Channel:
         self._s_mac = s_mac
         self._s_rmac = s_rmac
         self._security_level = security_level
+        # Session-constant security level bits, tested on every APDU.
+        self._c_mac_on = bool(security_level & C_MAC)
+        self._c_dec_on = bool(security_level & C_DECRYPTION)
+        self._r_mac_on = bool(security_level & R_MAC)
         self._i_param = i_param
         self._icv = _ZERO_ICV
         self._last_c_mac = _ZERO_ICV
+        self._enc_key = TripleDES(_tdes_key(s_enc))
+        self._c_mac = _RetailMac(s_mac)
+        self._r_mac = _RetailMac(s_rmac)
 
     @property
     def security_level(self) -> int:
@@ -214,36 +251,45 @@ class SCP02Channel:
         # Encrypt chaining value when bit 3 (0x04) is set (skip for initial zero).
         # GP spec: "one key Triple DES in ECB mode" — K1 of the S-MAC key only.
         if icv != _ZERO_ICV and (self._i_param & 0x04):
-            icv = _des_ecb(self._s_mac, icv)
+            icv = self._c_mac.encrypt_icv(icv)
         return icv
 
     def wrap(self, apdu: APDU) -> APDU:
         """Apply C-MAC (and optionally C-DECRYPTION) to an outgoing command."""
-        if not (self._security_level & C_MAC) and apdu.ins != 0x82:
+        if not self._c_mac_on and apdu.ins != 0x82:
             return apdu
 
         data = apdu.data
 
         # Encrypt command data if required (skip EXTERNAL AUTHENTICATE)
-        if (self._security_level & C_DECRYPTION) and data and apdu.ins != 0x82:
-            data = _tdes_cbc(self._s_enc, _ZERO_ICV, pad80(data, 8))
+        if self._c_dec_on and data and apdu.ins != 0x82:
+            enc = Cipher(self._enc_key, modes.CBC(_ZERO_ICV)).encryptor()
+            data = enc.update(pad80(data, 8)) + enc.finalize()
 
         # CLA with secure messaging indicator (bit 2)
         cla = apdu.cla | 0x04
         lc = len(data) + 8
 
         # Build MAC input — bit 1 (0x01): 0=unmodified APDU, 1=modified APDU
+        mac_input: bytes | bytearray
         if self._i_param & 0x01:
             # Modified APDU (CLA with secure messaging bit, Lc includes MAC)
-            mac_input = bytes([cla, apdu.ins, apdu.p1, apdu.p2, lc]) + data
-        else:
+            mac_input = bytearray(5 + len(data))
+            _MAC_HEADER.pack_into(mac_input, 0, cla, apdu.ins, apdu.p1, apdu.p2, lc)
+            mac_input[5:] = data
+        elif apdu.data:
             # Unmodified APDU (original CLA, original Lc)
-            mac_input = bytes([apdu.cla, apdu.ins, apdu.p1, apdu.p2])
-            if apdu.data:
-                mac_input += bytes([len(apdu.data)]) + apdu.data
+            mac_input = bytearray(5 + len(apdu.data))
+            _MAC_HEADER.pack_into(
+                mac_input, 0, apdu.cla, apdu.ins, apdu.p1, apdu.p2, len(apdu.data)
+            )
+            mac_input[5:] = apdu.data
+        else:
+            # Unmodified APDU without data: header only, no Lc
+            mac_input = _MAC_HEADER_NO_LC.pack(apdu.cla, apdu.ins, apdu.p1, apdu.p2)
 
         icv = self._next_icv()
-        c_mac = _retail_mac(self._s_mac, icv, mac_input)
+        c_mac = self._c_mac.compute(icv, mac_input)
         self._icv = c_mac
         self._last_c_mac = c_mac
 
@@ -258,7 +304,7 @@ class SCP02Channel:
 
     def unwrap(self, response: Response) -> Response:
         """Verify R-MAC on an incoming response."""
-        if not (self._security_level & R_MAC):
+        if not self._r_mac_on:
             return response
 
         data = response.data
@@ -268,8 +314,8 @@ class SCP02Channel:
         payload = data[:-8]
         r_mac = data[-8:]
 
-        mac_input = payload + bytes([response.sw1, response.sw2])
-        expected = _retail_mac(self._s_rmac, self._last_c_mac, mac_input)
+        mac_input = payload + _SW.pack(response.sw1, response.sw2)
+        expected = self._r_mac.compute(self._last_c_mac, mac_input)
         if expected != r_mac:
             raise ValueError("R-MAC verification failed")
 
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import struct
+
 from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
 from cryptography.hazmat.primitives.cmac import CMAC
 
@@ -16,38 +18,66 @@ _S_ENC = 0x04
 _S_MAC = 0x06
 _S_RMAC = 0x07
 
+# _kdf derivation data up to and including the counter, for L = 0x0040
+_CRYPTOGRAM_PREFIX = {
+    c: b"\x00" * 11 + bytes([c, 0x00, 0x00, 0x40, 0x01])
+    for c in (_CARD_CRYPTOGRAM, _HOST_CRYPTOGRAM)
+}
+
+_MAC_HEADER = struct.Struct(">BBBBB")  # CLA INS P1 P2 Lc
+_SW = struct.Struct(">BB")  # SW1 SW2
+
 
-def _cmac(key: bytes, data: bytes) -> bytes:
-    """Compute 16-byte AES-CMAC."""
-    c = CMAC(algorithms.AES(key))
+def _keyed_cmac(key: bytes) -> CMAC:
+    """AES-CMAC context with *key* set up, to be copied per message."""
+    return CMAC(algorithms.AES(key))
+
+
+def _cmac_copy(keyed: CMAC, data: bytes | bytearray) -> bytes:
+    """Compute 16-byte AES-CMAC from a copy of an already-keyed context."""
+    c = keyed.copy()
     c.update(data)
     return c.finalize()
 
 
-def _kdf(key: bytes, constant: int, context: bytes, length_bits: int) -> bytes:
+def _deriv_block(constant: int, length_bits: int, context: bytes) -> bytearray:
+    """Build _kdf derivation data for counter 1; the counter is byte 15."""
+    data = bytearray(16 + len(context))
+    data[11] = constant
+    data[13] = length_bits >> 8
+    data[14] = length_bits & 0xFF
+    data[15] = 0x01
+    data[16:] = context
+    return data
+
+
+def _kdf(keyed: CMAC, constant: int, context: bytes, length_bits: int) -> bytes:
     """SCP03 KDF (NIST SP 800-108 counter mode, AES-CMAC PRF).
 
     Derivation data per iteration (32 bytes):
       [00]*11 || constant || 00 || L (2 bytes) || counter || context (16 bytes)
 
     For outputs > 128 bits, multiple iterations with incrementing counter
-    are concatenated and truncated to the requested length.
+    are concatenated and truncated to the requested length.  *keyed* is a
+    keyed CMAC context (see _keyed_cmac) so one key setup can serve
+    several derivations.
     """
     length_bytes = (length_bits + 7) // 8
     # Each AES-CMAC iteration produces 16 bytes
     n_blocks = (length_bytes + 15) // 16
-    result = b""
+    data = _deriv_block(constant, length_bits, context)
+    if n_blocks == 1:
+        return _cmac_copy(keyed, data)[:length_bytes]
+    blocks = []
     for counter in range(1, n_blocks + 1):
-        data = (
-            b"\x00" * 11
-            + bytes([constant])
-            + b"\x00"
-            + length_bits.to_bytes(2, "big")
-            + bytes([counter])
-            + context
-        )
-        result += _cmac(key, data)
-    return result[:length_bytes]
+        data[15] = counter
+        blocks.append(_cmac_copy(keyed, data))
+    return b"".join(blocks)[:length_bytes]
+
+
+def _cryptogram(keyed: CMAC, constant: int, context: bytes) -> bytes:
+    """8-byte card/host cryptogram: one _kdf iteration with L = 64 bits."""
+    return _cmac_copy(keyed, _CRYPTOGRAM_PREFIX[constant] + context)[:8]
 
 
 def derive_session_keys(
@@ -61,12 +91,27 @@ def derive_session_keys(
     """
     context = host_challenge + card_challenge
     key_bits = len(static_keys.enc) * 8
-    s_enc = _kdf(static_keys.enc, _S_ENC, context, key_bits)
-    s_mac = _kdf(static_keys.mac, _S_MAC, context, key_bits)
-    s_rmac = _kdf(static_keys.mac, _S_RMAC, context, key_bits)
+    mac_key = _keyed_cmac(static_keys.mac)
+    s_enc = _kdf(_keyed_cmac(static_keys.enc), _S_ENC, context, key_bits)
+    s_mac = _kdf(mac_key, _S_MAC, context, key_bits)
+    s_rmac = _kdf(mac_key, _S_RMAC, context, key_bits)
     return s_enc, s_mac, s_rmac
 
 
+def _card_cryptogram(
+    mac_key: CMAC, host_challenge: bytes, card_challenge: bytes
+) -> bytes:
+    """Card cryptogram under an already-keyed S-MAC context."""
+    return _cryptogram(mac_key, _CARD_CRYPTOGRAM, host_challenge + card_challenge)
+
+
+def _host_cryptogram(
+    mac_key: CMAC, host_challenge: bytes, card_challenge: bytes
+) -> bytes:
+    """Host cryptogram under an already-keyed S-MAC context."""
+    return _cryptogram(mac_key, _HOST_CRYPTOGRAM, host_challenge + card_challenge)
+
+
 def verify_card_cryptogram(
     s_mac: bytes,
     host_challenge: bytes,
@@ -74,8 +119,7 @@ def verify_card_cryptogram(
     received: bytes,
 ) -> bool:
     """Verify the card cryptogram from INITIALIZE UPDATE."""
-    context = host_challenge + card_challenge
-    expected = _kdf(s_mac, _CARD_CRYPTOGRAM, context, 0x0040)[:8]
+    expected = _card_cryptogram(_keyed_cmac(s_mac), host_challenge, card_challenge)
     return expected == received
 
 
@@ -85,8 +129,7 @@ def compute_host_cryptogram(
     card_challenge: bytes,
 ) -> bytes:
     """Compute the host cryptogram for EXTERNAL AUTHENTICATE."""
-    context = host_challenge + card_challenge
-    return _kdf(s_mac, _HOST_CRYPTOGRAM, context, 0x0040)[:8]
+    return _host_cryptogram(_keyed_cmac(s_mac), host_challenge, card_challenge)
 
 
 # -- session establishment ----------------------------------------------------
@@ -114,14 +157,12 @@ def establish(
         static_keys, host_challenge, card_challenge
     )
 
-    if not verify_card_cryptogram(
-        s_mac, host_challenge, card_challenge, card_cryptogram
-    ):
+    # One S-MAC key setup serves both the card and host cryptograms.
+    mac_key = _keyed_cmac(s_mac)
+    if _card_cryptogram(mac_key, host_challenge, card_challenge) != card_cryptogram:
         raise ValueError("card cryptogram mismatch")
 
-    host_cryptogram = compute_host_cryptogram(
-        s_mac, host_challenge, card_challenge
-    )
+    host_cryptogram = _host_cryptogram(mac_key, host_challenge, card_challenge)
 
     channel = SCP03Channel(s_enc, s_mac, s_rmac, security_level)
 
@@ -154,8 +195,18 @@ class SCP03Channel:
         self._s_mac = s_mac
         self._s_rmac = s_rmac
         self._security_level = security_level
+        # Session-constant security level bits, tested on every APDU.
+        self._c_mac_on = bool(security_level & C_MAC)
+        self._c_dec_on = bool(security_level & C_DECRYPTION)
+        self._r_mac_on = bool(security_level & R_MAC)
         self._mac_chain = b"\x00" * 16
         self._enc_counter = 1
+        # S-ENC key object and counter ECB encryptor are reused across APDUs.
+        self._enc_key = algorithms.AES(s_enc)
+        self._icv_enc = Cipher(self._enc_key, modes.ECB()).encryptor()
+        # Keyed CMAC contexts, copied per APDU so the key is set up only once.
+        self._c_mac = _keyed_cmac(s_mac)
+        self._r_mac = _keyed_cmac(s_rmac)
 
     @property
     def security_level(self) -> int:
@@ -163,25 +214,22 @@ class SCP03Channel:
 
     def _next_enc_icv(self) -> bytes:
         """Derive encryption ICV from counter, then increment."""
-        block = self._enc_counter.to_bytes(16, "big")
-        cipher = Cipher(algorithms.AES(self._s_enc), modes.ECB())
-        enc = cipher.encryptor()
-        icv = enc.update(block) + enc.finalize()
+        icv = self._icv_enc.update(self._enc_counter.to_bytes(16, "big"))
         self._enc_counter += 1
         return icv
 
     def wrap(self, apdu: APDU) -> APDU:
         """Apply C-MAC (and optionally C-DECRYPTION) to an outgoing command."""
-        if not (self._security_level & C_MAC) and apdu.ins != 0x82:
+        if not self._c_mac_on and apdu.ins != 0x82:
             return apdu
 
         data = apdu.data
 
         # Encrypt command data if required (before MAC)
-        if (self._security_level & C_DECRYPTION) and data:
+        if self._c_dec_on and data:
             icv = self._next_enc_icv()
             padded = pad80(data, 16)
-            cipher = Cipher(algorithms.AES(self._s_enc), modes.CBC(icv))
+            cipher = Cipher(self._enc_key, modes.CBC(icv))
             enc = cipher.encryptor()
             data = enc.update(padded) + enc.finalize()
 
@@ -190,12 +238,11 @@ class SCP03Channel:
 
         # MAC input: chaining value || header (with Lc including MAC) || data
         lc = len(data) + 8
-        mac_input = (
-            self._mac_chain
-            + bytes([cla, apdu.ins, apdu.p1, apdu.p2, lc])
-            + data
-        )
-        full_mac = _cmac(self._s_mac, mac_input)
+        mac_input = bytearray(21 + len(data))
+        mac_input[:16] = self._mac_chain
+        _MAC_HEADER.pack_into(mac_input, 16, cla, apdu.ins, apdu.p1, apdu.p2, lc)
+        mac_input[21:] = data
+        full_mac = _cmac_copy(self._c_mac, mac_input)
         self._mac_chain = full_mac
 
         return APDU(
@@ -209,7 +256,7 @@ class SCP03Channel:
 
     def unwrap(self, response: Response) -> Response:
         """Verify R-MAC (and optionally R-ENCRYPTION) on an incoming response."""
-        if not (self._security_level & R_MAC):
+        if not self._r_mac_on:
             return response
 
         data = response.data
@@ -221,9 +268,9 @@ class SCP03Channel:
 
         # R-MAC: chaining value || payload || SW
         mac_input = (
-            self._mac_chain + payload + bytes([response.sw1, response.sw2])
+            self._mac_chain + payload + _SW.pack(response.sw1, response.sw2)
         )
-        expected = _cmac(self._s_rmac, mac_input)[:8]
+        expected = _cmac_copy(self._r_mac, mac_input)[:8]
         if expected != r_mac:
             raise ValueError("R-MAC verification failed")
 
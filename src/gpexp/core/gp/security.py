@@ -11,7 +11,7 @@ R_MAC = 0x10
 R_ENCRYPTION = 0x20
 
 
-@dataclass
+@dataclass(slots=True)
 class StaticKeys:
     """Static key set for secure channel establishment."""
 
@@ -20,7 +20,7 @@ class StaticKeys:
     dek: bytes = b""
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionSetup:
     """Result of SCP session establishment (before EXTERNAL AUTHENTICATE)."""
 
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import os
+import struct
 
 from gpexp.core.base import Agent
 from gpexp.core.base.terminal import handles
@@ -42,20 +43,46 @@ from gpexp.core.gp.padding import pad80
 _AES_KEY_TYPE = 0x88
 _DES_KEY_TYPE = 0x80
 
+# GetCardDataResult field -> GP GET DATA tag, in the order they are read
+_CARD_DATA_TAGS = (
+    ("key_info", 0x00E0),
+    ("card_recognition", 0x0066),
+    ("iin", 0x0042),
+    ("cin", 0x0045),
+    ("seq_counter", 0x00C1),
+)
+
+_KEY_HEADER_AES = struct.Struct(">BBB")  # type, key data length, key value length
+_KEY_HEADER_DES = struct.Struct(">BB")  # type, key data length
+
+
+_ZERO_BLOCK_8 = b"\x00" * 8
+_ZERO_BLOCK_16 = b"\x00" * 16
+_ONE_BLOCK_16 = b"\x01" * 16
 
-def _encrypt_key_des_dek(dek: bytes, key: bytes) -> bytes:
-    """Encrypt key value under a 3DES DEK (ECB mode)."""
-    k = dek + dek[:8]
-    cipher = Cipher(TripleDES(k), modes.ECB())
-    enc = cipher.encryptor()
-    return enc.update(key) + enc.finalize()
 
+def _encrypt_keys_des_dek(dek: TripleDES, keys: list[bytes]) -> list[bytes]:
+    """Encrypt key values under a 3DES DEK (ECB mode).
 
-def _encrypt_key_aes_dek(dek: bytes, key: bytes) -> bytes:
+    ECB blocks are independent, so the whole key set goes through one
+    encryptor pass and is split back per key afterwards.
+    """
+    if any(len(key) % 8 for key in keys):
+        raise ValueError("key length is not a multiple of the DES block size")
+    enc = Cipher(dek, modes.ECB()).encryptor()
+    joined = enc.update(b"".join(keys)) + enc.finalize()
+    encrypted = []
+    offset = 0
+    for key in keys:
+        encrypted.append(joined[offset : offset + len(key)])
+        offset += len(key)
+    return encrypted
+
+
+def _encrypt_key_aes_dek(dek: algorithms.AES, key: bytes) -> bytes:
     """Encrypt key value under an AES DEK (CBC mode, pad80)."""
     padded = pad80(key, 16)
-    cipher = Cipher(algorithms.AES(dek), modes.CBC(b"\x00" * 16))
-    enc = cipher.encryptor()
+    enc = Cipher(dek, modes.CBC(_ZERO_BLOCK_16)).encryptor()
     return enc.update(padded) + enc.finalize()
 
 
@@ -64,7 +91,7 @@ def _des_kcv(key: bytes) -> bytes:
     k = key + key[:8]
     cipher = Cipher(TripleDES(k), modes.ECB())
     enc = cipher.encryptor()
-    return (enc.update(b"\x00" * 8) + enc.finalize())[:3]
+    return (enc.update(_ZERO_BLOCK_8) + enc.finalize())[:3]
 
 
 def _aes_kcv(key: bytes, *, zero_block: bool = False) -> bytes:
@@ -73,7 +100,7 @@ def _aes_kcv(key: bytes, *, zero_block: bool = False) -> bytes:
     Some cards expect AES KCV over 0x00*16 (esp. when loading via SCP02/3DES),
     while SCP03/AES deployments often use 0x01*16.
     """
-    block = b"\x00" * 16 if zero_block else b"\x01" * 16
+    block = _ZERO_BLOCK_16 if zero_block else _ONE_BLOCK_16
     cipher = Cipher(algorithms.AES(key), modes.ECB())
     enc = cipher.encryptor()
     return (enc.update(block) + enc.finalize())[:3]
@@ -93,21 +120,37 @@ def _build_put_key_data(
     DES format:          type(1) | key_data_len(1) | encrypted(n)
                          | kcv_len(1) | kcv(3)
     """
-    encrypt = _encrypt_key_aes_dek if aes_dek else _encrypt_key_des_dek
+    # Expand the DEK once for all keys in the set.  AES-CBC restarts from a
+    # zero ICV for every key, so only the DES path can share one pass.
+    if aes_dek:
+        dek_key = algorithms.AES(dek)
+        encrypted_keys = [_encrypt_key_aes_dek(dek_key, key) for key in keys]
+    else:
+        encrypted_keys = _encrypt_keys_des_dek(TripleDES(dek + dek[:8]), keys)
     aes_format = key_type == _AES_KEY_TYPE
-    buf = bytearray([new_kvn])
-    for key in keys:
-        encrypted = encrypt(dek, key)
-        kcv = _aes_kcv(key) if aes_format else _des_kcv(key)
+    header_len = 3 if aes_dek else 2
+    # Every field length is known up front: size the buffer once.
+    total = 1 + sum(header_len + len(encrypted) + 4 for encrypted in encrypted_keys)
+    buf = bytearray(total)
+    buf[0] = new_kvn
+    offset = 1
+    kcv_of = _aes_kcv if aes_format else _des_kcv
+    # Key sets often repeat one value (e.g. test keys); compute each KCV once.
+    kcvs = {key: kcv_of(key) for key in keys}
+    for key, encrypted in zip(keys, encrypted_keys):
+        kcv = kcvs[key]
         if aes_dek:
             # AES DEK format: type || length || key_value_length || encrypted || kcv_len || kcv
-            buf.extend([key_type, 1 + len(encrypted), len(key)])
+            _KEY_HEADER_AES.pack_into(buf, offset, key_type, 1 + len(encrypted), len(key))
         else:
             # DES DEK format: type || length || encrypted || kcv_len || kcv
-            buf.extend([key_type, len(encrypted)])
-        buf.extend(encrypted)
-        buf.extend([0x03])
-        buf.extend(kcv)
+            _KEY_HEADER_DES.pack_into(buf, offset, key_type, len(encrypted))
+        offset += header_len
+        buf[offset : offset + len(encrypted)] = encrypted
+        offset += len(encrypted)
+        buf[offset] = 0x03
+        buf[offset + 1 : offset + 4] = kcv
+        offset += 4
     return bytes(buf)
 
 
@@ -137,13 +180,7 @@ class GPTerminal(GenericTerminal):
     @handles(GetCardDataMessage)
     def _get_card_data(self, message: GetCardDataMessage) -> GetCardDataResult:
         results = {}
-        for key, tag in [
-            ("key_info", 0x00E0),
-            ("card_recognition", 0x0066),
-            ("iin", 0x0042),
-            ("cin", 0x0045),
-            ("seq_counter", 0x00C1),
-        ]:
+        for key, tag in _CARD_DATA_TAGS:
             resp = self._gp.send_get_data(tag)
             results[key] = resp.data if resp.success else None
 
@@ -356,8 +393,8 @@ class GPTerminal(GenericTerminal):
             nodes = parse_tlv(info_data)
             for node in nodes:
                 if node.tag == 0xA1:
-                    inner = parse_tlv(node.value)
-                    for child in inner:
+                    # A1 is constructed, so parse_tlv already decoded its children
+                    for child in node.children:
                         if child.tag == 0x90 and child.value:
                             session_status = child.value[0]
                         elif child.tag == 0x4F:
@@ -4,6 +4,15 @@ import logging
 from typing import TYPE_CHECKING
 
 from smartcard.CardConnection import CardConnection
+from smartcard.scard import (
+    SCARD_S_SUCCESS,
+    SCARD_SCOPE_USER,
+    SCARD_STATE_PRESENT,
+    SCARD_STATE_UNAWARE,
+    SCardEstablishContext,
+    SCardGetStatusChange,
+    SCardReleaseContext,
+)
 from smartcard.System import readers
 
 from gpexp.core.smartcard.observer import LoggingCardObserver
@@ -30,6 +39,28 @@ class Card:
     def list_readers() -> list[Reader]:
         return readers()
 
+    @staticmethod
+    def readers_with_card(available: list[Reader]) -> list[Reader]:
+        """Return the readers in *available* that report a card present.
+
+        Uses a single non-blocking SCardGetStatusChange over all readers.
+        If the status query fails, *available* is returned unchanged so
+        the caller falls back to probing every reader.
+        """
+        hresult, context = SCardEstablishContext(SCARD_SCOPE_USER)
+        if hresult != SCARD_S_SUCCESS:
+            return available
+        try:
+            states = [(str(reader), SCARD_STATE_UNAWARE) for reader in available]
+            hresult, states = SCardGetStatusChange(context, 0, states)
+        finally:
+            SCardReleaseContext(context)
+        if hresult != SCARD_S_SUCCESS:
+            return available
+        present = {name for name, event_state, _atr in states
+                   if event_state & SCARD_STATE_PRESENT}
+        return [reader for reader in available if str(reader) in present]
+
     def connect(self, reader: Reader) -> None:
         self._connection = reader.createConnection()
         self._connection.addObserver(self._observer)
@@ -4,6 +4,14 @@ import logging
 
 TRACE = 15
 PROTOCOL = 18
+
+# SW1 values reported as success (normal processing, more data available)
+OK_SW1 = frozenset((0x90, 0x61))
+
+_GREEN = "\033[32m"
+_RED = "\033[31m"
+_RESET = "\033[0m"
+
 logging.addLevelName(TRACE, "TRACE")
 logging.addLevelName(PROTOCOL, "PROTOCOL")
 
@@ -14,3 +22,14 @@ def _trace(self, message, *args, **kwargs):
 
 
 logging.Logger.trace = _trace
+
+
+def log_status(logger: logging.Logger, sw: int, label: str, *args: object) -> None:
+    """Log *label* (a %-format over *args*) and the colored SW at PROTOCOL.
+
+    Callers check ``logger.isEnabledFor(PROTOCOL)`` first; bytes arguments
+    are rendered as upper-case hex here, so they cost nothing when disabled.
+    """
+    shown = tuple(a.hex().upper() if isinstance(a, bytes) else a for a in args)
+    color = _GREEN if (sw >> 8) in OK_SW1 else _RED
+    logger.log(PROTOCOL, f"{label} %s%04X%s", *shown, color, sw, _RESET, stacklevel=2)
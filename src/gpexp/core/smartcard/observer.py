@@ -4,7 +4,7 @@ import logging
 
 from smartcard.CardConnectionObserver import CardConnectionObserver
 
-from gpexp.core.smartcard.logging import PROTOCOL, TRACE
+from gpexp.core.smartcard.logging import OK_SW1, PROTOCOL, TRACE
 
 lg = logging.getLogger(__name__)
 
@@ -18,9 +18,7 @@ _RESET = "\033[0m"
 
 def _color_sw(sw1: int) -> str:
     """Return ANSI color for a status word: green for success, red for error."""
-    if sw1 == 0x90 or sw1 == 0x61:
-        return _GREEN
-    return _RED
+    return _GREEN if sw1 in OK_SW1 else _RED
 
 
 class LoggingCardObserver(CardConnectionObserver):
@@ -28,10 +26,12 @@ class LoggingCardObserver(CardConnectionObserver):
 
     def _log_hex(self, prefix: str, data: bytes) -> None:
         """Log hex data, wrapping at LINE_BYTES bytes per line."""
+        # Hex-encode once, then cut lines of LINE_BYTES "XX " groups.
+        text = data.hex(" ").upper()
+        width = LINE_BYTES * 3
         pad = " " * len(prefix)
-        for i in range(0, len(data), LINE_BYTES):
-            chunk = data[i : i + LINE_BYTES].hex(" ").upper()
-            lg.log(TRACE, "%s%s", prefix if i == 0 else pad, chunk)
+        for i in range(0, len(text), width):
+            lg.log(TRACE, "%s%s", prefix if i == 0 else pad, text[i : i + width - 1])
 
     def update(self, observable, event):
         if event.type == "connect":
@@ -43,6 +43,10 @@ class LoggingCardObserver(CardConnectionObserver):
         elif event.type == "disconnect":
             lg.log(PROTOCOL, "disconnect")
 
+        elif not lg.isEnabledFor(TRACE):
+            # command/response tracing is off: skip the copies and formatting
+            return
+
         elif event.type == "command":
             self._log_hex(">> ", bytes(event.args[0]))
 
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class TLV:
     """A single BER-TLV node."""
 
@@ -27,27 +28,31 @@ class TLV:
 
     def find_recursive(self, tag: int) -> TLV | None:
         """Find the first descendant with the given tag (depth-first)."""
-        for child in self.children:
-            if child.tag == tag:
-                return child
-            result = child.find_recursive(tag)
-            if result is not None:
-                return result
+        stack = self.children[::-1]
+        while stack:
+            node = stack.pop()
+            if node.tag == tag:
+                return node
+            stack.extend(reversed(node.children))
         return None
 
-    def format(self, tag_names: dict[int, str] | None = None, indent: int = 0) -> str:
+    def format(self, tag_names: Mapping[int, str] | None = None, indent: int = 0) -> str:
         """Format this TLV node as a human-readable tree."""
         names = tag_names or {}
-        tag_hex = f"{self.tag:02X}" if self.tag <= 0xFF else f"{self.tag:04X}"
-        name = names.get(self.tag, "")
-        prefix = "  " * indent
-        if self.children:
-            label = f"{prefix}{tag_hex} {name}".rstrip()
-            lines = [label]
-            for child in self.children:
-                lines.append(child.format(names, indent + 1))
-            return "\n".join(lines)
-        return f"{prefix}{tag_hex} {name}: {self.value.hex(' ').upper()}".rstrip()
+        lines = []
+        stack: list[tuple[TLV, int]] = [(self, indent)]
+        while stack:
+            node, depth = stack.pop()
+            tag_hex = f"{node.tag:02X}" if node.tag <= 0xFF else f"{node.tag:04X}"
+            name = names.get(node.tag, "")
+            prefix = "  " * depth
+            if node.children:
+                lines.append(f"{prefix}{tag_hex} {name}".rstrip())
+                stack.extend((child, depth + 1) for child in reversed(node.children))
+            else:
+                value = node.value.hex(" ").upper()
+                lines.append(f"{prefix}{tag_hex} {name}: {value}".rstrip())
+        return "\n".join(lines)
 
     def __repr__(self) -> str:
         tag_hex = f"{self.tag:02X}" if self.tag <= 0xFF else f"{self.tag:04X}"
@@ -60,20 +65,38 @@ class TLV:
 def parse(data: bytes) -> list[TLV]:
     """Parse a byte sequence into a list of BER-TLV nodes."""
     nodes: list[TLV] = []
-    offset = 0
-    while offset < len(data):
-        if data[offset] in (0x00, 0xFF):
-            offset += 1
-            continue
-        tag, offset = _read_tag(data, offset)
-        length, offset = _read_length(data, offset)
-        value = data[offset : offset + length]
-        offset += length
-
-        node = TLV(tag=tag, value=value)
-        if node.constructed:
-            node.children = parse(value)
-        nodes.append(node)
+    # Constructed values are parsed from an explicit work stack rather than
+    # by recursion; each entry is (value bytes, list to fill with children).
+    pending: list[tuple[bytes, list[TLV]]] = [(data, nodes)]
+    while pending:
+        data, out = pending.pop()
+        offset = 0
+        end = len(data)
+        while offset < end:
+            if data[offset] in (0x00, 0xFF):
+                offset += 1
+                continue
+            # Single-byte tags and short-form lengths are read inline; only
+            # multi-byte forms go through the helpers.
+            b = data[offset]
+            if (b & 0x1F) != 0x1F:
+                tag = b
+                offset += 1
+            else:
+                tag, offset = _read_tag(data, offset)
+            b = data[offset]
+            if b < 0x80:
+                length = b
+                offset += 1
+            else:
+                length, offset = _read_length(data, offset)
+            value = data[offset : offset + length]
+            offset += length
+
+            node = TLV(tag, value, [])
+            if node.constructed:
+                pending.append((value, node.children))
+            out.append(node)
     return nodes
 
 
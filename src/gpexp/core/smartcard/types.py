@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+import struct
 from dataclasses import dataclass, field
 
+_HEADER = struct.Struct(">BBBB")  # CLA INS P1 P2
+_U16 = struct.Struct(">H")
 
-@dataclass
+
+@dataclass(slots=True)
 class APDU:
     """ISO 7816 command APDU."""
 
@@ -15,45 +19,53 @@ class APDU:
     le: int | None = None
 
     def to_bytes(self) -> bytes:
-        buf = bytearray([self.cla, self.ins, self.p1, self.p2])
-        extended = len(self.data) > 255 or (self.le is not None and self.le > 256)
+        data = self.data
+        le = self.le
+        nc = len(data)
+        extended = nc > 255 or (le is not None and le > 256)
         if extended:
-            if self.data:
-                buf.append(0x00)
-                buf.extend(len(self.data).to_bytes(2, "big"))
-                buf.extend(self.data)
-            elif self.le is not None:
-                buf.append(0x00)
-            if self.le is not None:
-                le = 0x0000 if self.le == 65536 else self.le
-                buf.extend(le.to_bytes(2, "big"))
+            lc_size = 3 if nc else 0  # 00 || Lc(2)
+            le_size = 0 if le is None else 2 if nc else 3  # [00] || Le(2)
         else:
-            if self.data:
-                buf.append(len(self.data))
-                buf.extend(self.data)
-            if self.le is not None:
-                buf.append(0x00 if self.le == 256 else self.le)
+            lc_size = 1 if nc else 0
+            le_size = 0 if le is None else 1
+
+        # Size the buffer once and pack fields into it in place.
+        buf = bytearray(4 + lc_size + nc + le_size)
+        _HEADER.pack_into(buf, 0, self.cla, self.ins, self.p1, self.p2)
+        pos = 4
+        if nc:
+            if extended:
+                _U16.pack_into(buf, pos + 1, nc)
+            else:
+                buf[pos] = nc
+            pos += lc_size
+            buf[pos : pos + nc] = data
+        if le is not None:
+            if extended:
+                _U16.pack_into(buf, len(buf) - 2, 0x0000 if le == 65536 else le)
+            else:
+                buf[-1] = 0x00 if le == 256 else le
         return bytes(buf)
 
     def __repr__(self) -> str:
         return self.to_bytes().hex(" ").upper()
 
 
-@dataclass
+@dataclass(slots=True)
 class Response:
     """ISO 7816 response APDU."""
 
     data: bytes
     sw1: int
     sw2: int
+    # Derived from sw1/sw2 once at construction; responses are not mutated.
+    sw: int = field(init=False, compare=False)
+    success: bool = field(init=False, compare=False)
 
-    @property
-    def sw(self) -> int:
-        return (self.sw1 << 8) | self.sw2
-
-    @property
-    def success(self) -> bool:
-        return self.sw1 == 0x90 and self.sw2 == 0x00
+    def __post_init__(self) -> None:
+        self.sw = (self.sw1 << 8) | self.sw2
+        self.success = self.sw1 == 0x90 and self.sw2 == 0x00
 
     def __repr__(self) -> str:
         sw = f"SW={self.sw:04X}"
@@ -16,12 +16,12 @@ from dataclasses import dataclass
 from gpexp.core.base import Message, Result
 
 
-@dataclass
+@dataclass(slots=True)
 class GetVersionMessage(Message):
     """Request the card's version information."""
 
 
-@dataclass
+@dataclass(slots=True)
 class GetVersionResult(Result):
     """Version response from the card."""
 
@@ -29,14 +29,14 @@ class GetVersionResult(Result):
     sw: int
 
 
-@dataclass
+@dataclass(slots=True)
 class EchoMessage(Message):
     """Send data to the card and receive it back."""
 
     data: bytes
 
 
-@dataclass
+@dataclass(slots=True)
 class EchoResult(Result):
     """Echo response from the card."""
 
@@ -16,14 +16,10 @@ import logging
 from collections.abc import Callable
 
 from gpexp.core.smartcard import APDU, Response
-from gpexp.core.smartcard.logging import PROTOCOL
+from gpexp.core.smartcard.logging import PROTOCOL, log_status
 
 lg = logging.getLogger(__name__)
 
-_GREEN = "\033[32m"
-_RED = "\033[31m"
-_RESET = "\033[0m"
-
 
 class TemplateProtocol:
     """Protocol operations for the template card."""
@@ -31,10 +27,10 @@ class TemplateProtocol:
     def __init__(self, transmit: Callable[[APDU], Response]) -> None:
         self._transmit = transmit
 
-    def _send(self, label: str, apdu: APDU) -> Response:
+    def _send(self, apdu: APDU, label: str, *args: object) -> Response:
         resp = self._transmit(apdu)
-        color = _GREEN if resp.sw1 in (0x90, 0x61) else _RED
-        lg.log(PROTOCOL, "%s %s%04X%s", label, color, resp.sw, _RESET)
+        if lg.isEnabledFor(PROTOCOL):
+            log_status(lg, resp.sw, label, *args)
         return resp
 
     # -- commands (replace with your card's actual APDUs) --
@@ -45,7 +41,7 @@ class TemplateProtocol:
         Replace CLA/INS/P1/P2 with your card's actual command.
         """
         apdu = APDU(cla=0x80, ins=0x01, p1=0x00, p2=0x00, le=0x00)
-        return self._send("GET VERSION", apdu)
+        return self._send(apdu, "GET VERSION")
 
     def send_echo(self, data: bytes) -> Response:
         """Example: ECHO (80 02 00 00, data).
@@ -54,4 +50,4 @@ class TemplateProtocol:
         Replace with your card's actual command.
         """
         apdu = APDU(cla=0x80, ins=0x02, p1=0x00, p2=0x00, data=data, le=0x00)
-        return self._send("ECHO", apdu)
+        return self._send(apdu, "ECHO")
@@ -6,8 +6,6 @@ import logging
 
 import click
 
-from gpexp.core.smartcard.logging import PROTOCOL, TRACE
-
 
 @click.command()
 @click.option("-v", "--verbose", is_flag=True, help="TRACE level (show raw APDUs).")
@@ -29,6 +27,10 @@ from gpexp.core.smartcard.logging import PROTOCOL, TRACE
 )
 def gpexp(verbose, file, runner):
 
+    # Deferred: importing gpexp.core pulls in pyscard and cryptography,
+    # which --help and usage errors never need.
+    from gpexp.core.smartcard.logging import PROTOCOL, TRACE
+
     logging.basicConfig(
         level=TRACE if verbose else PROTOCOL,
         format="%(levelname)-8s %(name)s: %(message)s",
@@ -27,6 +27,7 @@ from __future__ import annotations
 
 import argparse
 import sys
+from functools import lru_cache
 
 # ---------------------------------------------------------------------------
 # Cryptographic primitives
@@ -42,14 +43,15 @@ def _hex(data: bytes) -> str:
 
 
 def _hex_spaced(data: bytes) -> str:
-    return " ".join(f"{b:02X}" for b in data)
+    return data.hex(" ").upper()
 
 
 # -- padding ----------------------------------------------------------------
 
 def _pad80(data: bytes, block_size: int) -> bytes:
     """ISO 9797-1 Method 2 padding."""
-    return data + b"\x80" + b"\x00" * ((-len(data) - 1) % block_size)
+    n = len(data) + 1
+    return (data + b"\x80").ljust(n + (-n) % block_size, b"\x00")
 
 
 # -- 3DES helpers (SCP02) --------------------------------------------------
@@ -59,9 +61,15 @@ def _tdes_key(key_2k: bytes) -> bytes:
     return key_2k + key_2k[:8]
 
 
+@lru_cache(maxsize=8)
+def _tdes(key_2k: bytes) -> TripleDES:
+    """Expanded 3DES key object, shared by every operation under *key_2k*."""
+    return TripleDES(_tdes_key(key_2k))
+
+
 def _tdes_ecb(key_2k: bytes, block: bytes) -> bytes:
-    cipher = Cipher(TripleDES(_tdes_key(key_2k)), modes.ECB())
-    return cipher.encryptor().update(block) + cipher.encryptor().finalize()
+    enc = Cipher(_tdes(key_2k), modes.ECB()).encryptor()
+    return enc.update(block) + enc.finalize()
 
 
 def _des_ecb(key_2k: bytes, block: bytes) -> bytes:
@@ -73,7 +81,7 @@ def _des_ecb(key_2k: bytes, block: bytes) -> bytes:
 
 
 def _tdes_cbc(key_2k: bytes, iv: bytes, data: bytes) -> bytes:
-    cipher = Cipher(TripleDES(_tdes_key(key_2k)), modes.CBC(iv))
+    cipher = Cipher(_tdes(key_2k), modes.CBC(iv))
     enc = cipher.encryptor()
     return enc.update(data) + enc.finalize()
 
@@ -91,28 +99,44 @@ def _retail_mac(key_2k: bytes, icv: bytes, data: bytes) -> bytes:
     Single-DES (K1) for blocks 1..n-1, full 3DES for block n.
     """
     padded = _pad80(data, 8)
-    k1_3 = key_2k[:8] * 3
-    k_full = _tdes_key(key_2k)
+    head, tail = padded[:-8], padded[-8:]
     cv = icv
-    n = len(padded) // 8
-    for i in range(n):
-        xored = bytes(a ^ b for a, b in zip(padded[i * 8 : (i + 1) * 8], cv))
-        k = k_full if i == n - 1 else k1_3
-        cipher = Cipher(TripleDES(k), modes.ECB())
-        enc = cipher.encryptor()
-        cv = enc.update(xored) + enc.finalize()
-    return cv
+    if head:
+        # Blocks 1..n-1 are plain single-DES-CBC-MAC: one CBC pass with K1.
+        enc = Cipher(TripleDES(key_2k[:8] * 3), modes.CBC(icv)).encryptor()
+        cv = (enc.update(head) + enc.finalize())[-8:]
+    xored = (int.from_bytes(tail, "big") ^ int.from_bytes(cv, "big")).to_bytes(8, "big")
+    return _tdes_ecb(key_2k, xored)
 
 
 # -- AES helpers (SCP03) ---------------------------------------------------
 
+@lru_cache(maxsize=8)
+def _keyed_cmac(key: bytes) -> CMAC:
+    """AES-CMAC context with *key* (and its subkeys) set up, for copying."""
+    return CMAC(algorithms.AES(key))
+
+
 def _aes_cmac(key: bytes, data: bytes) -> bytes:
     """Compute 16-byte AES-CMAC."""
-    c = CMAC(algorithms.AES(key))
+    c = _keyed_cmac(key).copy()
     c.update(data)
     return c.finalize()
 
 
+def _scp03_deriv_data(
+    constant: int, length_bits: int, counter: int, context: bytes
+) -> bytes:
+    """00*11 || constant || 00 || L(2) || counter || context."""
+    data = bytearray(16 + len(context))
+    data[11] = constant
+    data[13] = length_bits >> 8
+    data[14] = length_bits & 0xFF
+    data[15] = counter
+    data[16:] = context
+    return bytes(data)
+
+
 def _scp03_kdf(key: bytes, constant: int, context: bytes, length_bits: int) -> bytes:
     """SCP03 KDF — NIST SP 800-108 counter mode with AES-CMAC PRF.
 
@@ -121,18 +145,15 @@ def _scp03_kdf(key: bytes, constant: int, context: bytes, length_bits: int) -> b
     """
     length_bytes = (length_bits + 7) // 8
     n_blocks = (length_bytes + 15) // 16
-    result = b""
+    if n_blocks == 1:
+        # AES-128 session keys and cryptograms: a single CMAC, no loop.
+        data = _scp03_deriv_data(constant, length_bits, 1, context)
+        return _aes_cmac(key, data)[:length_bytes]
+    blocks = []
     for counter in range(1, n_blocks + 1):
-        data = (
-            b"\x00" * 11
-            + bytes([constant])
-            + b"\x00"
-            + length_bits.to_bytes(2, "big")
-            + bytes([counter])
-            + context
-        )
-        result += _aes_cmac(key, data)
-    return result[:length_bytes]
+        data = _scp03_deriv_data(constant, length_bits, counter, context)
+        blocks.append(_aes_cmac(key, data))
+    return b"".join(blocks)[:length_bytes]
 
 
 # ---------------------------------------------------------------------------
@@ -319,8 +340,8 @@ def _build_ext_auth_scp02(
     c_mac = _retail_mac(s_mac, icv, mac_input)
     print(f"  C-MAC:        {_hex(c_mac)}")
 
-    apdu_data = data + c_mac
-    apdu = bytes([cla, ins, p1, p2, len(apdu_data)]) + apdu_data
+    header = bytes([cla, ins, p1, p2, len(data) + len(c_mac)])
+    apdu = b"".join((header, data, c_mac))
     print(f"\n  EXTERNAL AUTHENTICATE APDU:")
     print(f"    {_hex_spaced(apdu)}")
 
@@ -335,6 +356,11 @@ _SCP03_DERIV = {
     "S-RMAC": 0x07,
 }
 
+# Cryptogram derivation data up to the context: constant, L = 0x0040, counter 1
+_SCP03_CRYPTOGRAM_PREFIX = {
+    c: b"\x00" * 11 + bytes([c, 0x00, 0x00, 0x40, 0x01]) for c in (0x00, 0x01)
+}
+
 
 def debug_scp03(
     enc_key: bytes,
@@ -410,28 +436,21 @@ def debug_scp03(
         static_key = keys_map[name]
         length_bytes = len(static_key)
         n_iter = (length_bytes + 15) // 16
-        result = b""
+        blocks = []
 
         print(f"  {name} (constant=0x{constant:02X}):")
         print(f"    Static key:  {_hex(static_key)}")
 
         for counter in range(1, n_iter + 1):
-            deriv_data = (
-                b"\x00" * 11
-                + bytes([constant])
-                + b"\x00"
-                + key_bits.to_bytes(2, "big")
-                + bytes([counter])
-                + context
-            )
+            deriv_data = _scp03_deriv_data(constant, key_bits, counter, context)
             block_result = _aes_cmac(static_key, deriv_data)
-            result += block_result
+            blocks.append(block_result)
 
             label = "" if n_iter == 1 else f" (block {counter})"
             print(f"    Derivation data{label}: {_hex(deriv_data)}")
             print(f"    AES-CMAC result{label}: {_hex(block_result)}")
 
-        session_key = result[:length_bytes]
+        session_key = b"".join(blocks)[:length_bytes]
         session_keys[name] = session_key
         print(f"    Session key: {_hex(session_key)}")
         print()
@@ -443,14 +462,7 @@ def debug_scp03(
     # -- Card cryptogram verification ---------------------------------------
     print("--- Card Cryptogram Verification ---\n")
     print(f"  KDF(S-MAC, constant=0x00, context, 64 bits)")
-    deriv_data = (
-        b"\x00" * 11
-        + bytes([0x00])
-        + b"\x00"
-        + (0x0040).to_bytes(2, "big")
-        + bytes([0x01])
-        + context
-    )
+    deriv_data = _SCP03_CRYPTOGRAM_PREFIX[0x00] + context
     full_result = _aes_cmac(s_mac, deriv_data)
     expected_card_crypt = full_result[:8]
 
@@ -465,14 +477,7 @@ def debug_scp03(
     # -- Host cryptogram computation ----------------------------------------
     print("\n--- Host Cryptogram Computation ---\n")
     print(f"  KDF(S-MAC, constant=0x01, context, 64 bits)")
-    deriv_data = (
-        b"\x00" * 11
-        + bytes([0x01])
-        + b"\x00"
-        + (0x0040).to_bytes(2, "big")
-        + bytes([0x01])
-        + context
-    )
+    deriv_data = _SCP03_CRYPTOGRAM_PREFIX[0x01] + context
     full_result = _aes_cmac(s_mac, deriv_data)
     host_cryptogram = full_result[:8]
 
@@ -524,8 +529,8 @@ def _build_ext_auth_scp03(
     print(f"  AES-CMAC:      {_hex(full_mac)}")
     print(f"  C-MAC (8B):    {_hex(c_mac)}")
 
-    apdu_data = data + c_mac
-    apdu = bytes([cla, ins, p1, p2, len(apdu_data)]) + apdu_data
+    header = bytes([cla, ins, p1, p2, len(data) + len(c_mac)])
+    apdu = b"".join((header, data, c_mac))
     print(f"\n  EXTERNAL AUTHENTICATE APDU:")
     print(f"    {_hex_spaced(apdu)}")
 
@@ -534,9 +539,12 @@ def _build_ext_auth_scp03(
 # CLI
 # ---------------------------------------------------------------------------
 
+_HEX_SEPARATORS = str.maketrans("", "", " :-")
+
+
 def parse_hex(s: str) -> bytes:
     """Parse a hex string, stripping whitespace and optional 0x prefix."""
-    s = s.strip().replace(" ", "").replace(":", "").replace("-", "")
+    s = s.strip().translate(_HEX_SEPARATORS)
     if s.lower().startswith("0x"):
         s = s[2:]
     return bytes.fromhex(s)